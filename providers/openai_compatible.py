@@ -202,13 +202,8 @@ class OpenAICompatibleProvider(ModelProvider):
             import httpx
 
             # Temporarily disable proxy environment variables to prevent httpx from detecting them
-            original_env = {}
             proxy_env_vars = ["HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "http_proxy", "https_proxy", "all_proxy"]
-
-            for var in proxy_env_vars:
-                if var in os.environ:
-                    original_env[var] = os.environ[var]
-                    del os.environ[var]
+            original_env = {var: os.environ.pop(var) for var in proxy_env_vars if var in os.environ}
 
             try:
                 # Create a custom httpx client that explicitly avoids proxy parameters
@@ -258,9 +253,8 @@ class OpenAICompatibleProvider(ModelProvider):
                     logging.error(f"Even minimal OpenAI client creation failed: {fallback_error}")
                     raise
             finally:
-                # Restore original proxy environment variables
-                for var, value in original_env.items():
-                    os.environ[var] = value
+                # Restore original proxy environment variables in a single batch
+                os.environ.update(original_env)
 
         return self._client
 
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Optional
 
 from .base import ModelProvider, ProviderType
@@ -9,6 +10,17 @@ from .base import ModelProvider, ProviderType
 if TYPE_CHECKING:
     from tools.models import ToolModelCategory
 
+# Environment variable holding the API key for each provider (built once at import)
+_PROVIDER_API_KEY_ENV = MappingProxyType(
+    {
+        ProviderType.GOOGLE: "GEMINI_API_KEY",
+        ProviderType.OPENAI: "OPENAI_API_KEY",
+        ProviderType.XAI: "XAI_API_KEY",
+        ProviderType.OPENROUTER: "OPENROUTER_API_KEY",
+        ProviderType.CUSTOM: "CUSTOM_API_KEY",  # Can be empty for providers that don't need auth
+    }
+)
+
 
 class ModelProviderRegistry:
     """Registry for managing model providers."""
@@ -231,15 +243,7 @@ class ModelProviderRegistry:
         Returns:
             API key string or None if not found
         """
-        key_mapping = {
-            ProviderType.GOOGLE: "GEMINI_API_KEY",
-            ProviderType.OPENAI: "OPENAI_API_KEY",
-            ProviderType.XAI: "XAI_API_KEY",
-            ProviderType.OPENROUTER: "OPENROUTER_API_KEY",
-            ProviderType.CUSTOM: "CUSTOM_API_KEY",  # Can be empty for providers that don't need auth
-        }
-
-        env_var = key_mapping.get(provider_type)
+        env_var = _PROVIDER_API_KEY_ENV.get(provider_type)
         if not env_var:
             return None
 
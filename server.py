@@ -27,7 +27,15 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any, Optional
 
-from dotenv import load_dotenv
+# Answer --version before importing the MCP SDK, providers and tools so the
+# fast-exit path does not pay for the full server import graph
+if __name__ == "__main__" and sys.argv[1:2] in (["--version"], ["-V"]):
+    from config import __version__
+
+    print(__version__)
+    sys.exit(0)
+
+from dotenv import load_dotenv  # noqa: E402
 
 # Load environment variables from .env file in the script's directory
 # This ensures .env is loaded regardless of the current working directory
@@ -1139,9 +1147,32 @@ async def main():
         )
 
 
+def run_event_loop(coro) -> None:
+    """
+    Run the server coroutine, preferring uvloop when it is installed.
+
+    uvloop replaces the pure-Python selector loop with a libuv-based one,
+    lowering per-message overhead on the stdio transport. It does not
+    support Windows, so the standard asyncio loop is used there.
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            uvloop = None
+        if uvloop is not None:
+            uvloop_run = getattr(uvloop, "run", None)
+            if uvloop_run is not None:
+                uvloop_run(coro)
+                return
+            # uvloop < 0.18 has no run(); install its event loop policy instead
+            uvloop.install()
+    asyncio.run(coro)
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_event_loop(main())
     except KeyboardInterrupt:
         # Handle graceful shutdown
         pass
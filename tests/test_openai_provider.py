@@ -214,6 +214,25 @@ class TestOpenAIProvider:
         call_kwargs = mock_client.chat.completions.create.call_args[1]
         assert call_kwargs["model"] == "o3-mini"  # Should be unchanged
 
+    @patch.dict(os.environ, {"HTTPS_PROXY": "http://proxy.example:8080", "all_proxy": "socks5://proxy.example"})
+    @patch("providers.openai_compatible.OpenAI")
+    def test_client_init_hides_and_restores_proxy_env(self, mock_openai_class):
+        """Test that proxy variables are hidden during client creation and restored afterwards."""
+        seen_env = {}
+
+        def capture_env(**kwargs):
+            seen_env.update({var: os.environ.get(var) for var in ("HTTPS_PROXY", "all_proxy")})
+            return MagicMock()
+
+        mock_openai_class.side_effect = capture_env
+
+        provider = OpenAIModelProvider("test-key")
+        assert provider.client is not None
+
+        assert seen_env == {"HTTPS_PROXY": None, "all_proxy": None}
+        assert os.environ["HTTPS_PROXY"] == "http://proxy.example:8080"
+        assert os.environ["all_proxy"] == "socks5://proxy.example"
+
     def test_supports_thinking_mode(self):
         """Test thinking mode support (currently False for all OpenAI models)."""
         provider = OpenAIModelProvider("test-key")
@@ -3,11 +3,13 @@
 import json
 import os
 import tempfile
+from unittest.mock import patch
 
 import pytest
 
 from providers.base import ProviderType
 from providers.openrouter_registry import OpenRouterModelConfig, OpenRouterModelRegistry
+from utils.file_utils import read_json_file
 
 
 class TestOpenRouterModelRegistry:
@@ -197,6 +199,30 @@ class TestOpenRouterModelRegistry:
         finally:
             os.unlink(temp_path)
 
+    def test_reload_picks_up_config_edits(self):
+        """Test that each load reads the config file and reload() picks up edits."""
+        config_data = {"models": [{"model_name": "reload/model", "aliases": ["before"], "context_window": 4096}]}
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(config_data, f)
+            temp_path = f.name
+
+        try:
+            with patch("providers.openrouter_registry.read_json_file", wraps=read_json_file) as mock_read:
+                registry = OpenRouterModelRegistry(config_path=temp_path)
+                assert mock_read.call_count == 1
+                assert registry.resolve("before").model_name == "reload/model"
+
+                config_data["models"][0]["aliases"] = ["after"]
+                with open(temp_path, "w") as f:
+                    json.dump(config_data, f)
+                registry.reload()
+                assert mock_read.call_count == 2
+                assert registry.resolve("after").model_name == "reload/model"
+                assert registry.resolve("before") is None
+        finally:
+            os.unlink(temp_path)
+
     def test_model_with_all_capabilities(self):
         """Test model with all capability flags."""
         config = OpenRouterModelConfig(
@@ -106,3 +106,90 @@ class TestServerTools:
         assert "thinkdeep" in content
         assert "docgen" in content
         assert "version" in content
+
+    def test_run_event_loop_without_uvloop(self):
+        """Test that the standard asyncio loop is used when uvloop is unavailable"""
+        import sys
+        from unittest.mock import patch
+
+        from server import run_event_loop
+
+        async def sample():
+            return None
+
+        with patch.dict(sys.modules, {"uvloop": None}), patch("server.asyncio.run") as mock_run:
+            coro = sample()
+            run_event_loop(coro)
+            mock_run.assert_called_once_with(coro)
+            coro.close()
+
+    def test_run_event_loop_prefers_uvloop(self):
+        """Test that uvloop runs the server when it is installed"""
+        import sys
+        import types
+        from unittest.mock import MagicMock, patch
+
+        from server import run_event_loop
+
+        async def sample():
+            return None
+
+        fake_uvloop = types.ModuleType("uvloop")
+        fake_uvloop.run = MagicMock()
+
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}), patch("server.sys.platform", "linux"):
+            with patch("server.asyncio.run") as mock_run:
+                coro = sample()
+                run_event_loop(coro)
+                fake_uvloop.run.assert_called_once_with(coro)
+                mock_run.assert_not_called()
+                coro.close()
+
+    def test_run_event_loop_with_old_uvloop(self):
+        """Test that uvloop versions without run() install the policy and use asyncio.run"""
+        import sys
+        import types
+        from unittest.mock import MagicMock, patch
+
+        from server import run_event_loop
+
+        async def sample():
+            return None
+
+        old_uvloop = types.ModuleType("uvloop")
+        old_uvloop.install = MagicMock()
+
+        with patch.dict(sys.modules, {"uvloop": old_uvloop}), patch("server.sys.platform", "linux"):
+            with patch("server.asyncio.run") as mock_run:
+                coro = sample()
+                run_event_loop(coro)
+                old_uvloop.install.assert_called_once_with()
+                mock_run.assert_called_once_with(coro)
+                coro.close()
+
+    def test_version_flag_exits_before_server_imports(self):
+        """Test that --version prints the version without starting the server"""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        from config import __version__
+
+        server_script = Path(__file__).resolve().parent.parent / "server.py"
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", str(server_script), "--version"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == __version__
+
+        # -X importtime writes "import time: self | cumulative | module" lines to stderr
+        imported = {
+            line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")
+        }
+        assert "config" in imported
+        for package in ("mcp", "providers", "tools", "dotenv"):
+            assert not any(name == package or name.startswith(f"{package}.") for name in imported), package
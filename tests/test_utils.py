@@ -2,7 +2,10 @@
 Tests for utility functions
 """
 
-from utils import check_token_limit, estimate_tokens, read_file_content, read_files
+import pytest
+
+from utils import check_token_limit, estimate_tokens, file_utils, read_file_content, read_files
+from utils.file_utils import read_json_file
 
 
 class TestFileUtils:
@@ -200,6 +203,22 @@ class TestFileUtils:
         assert "binary.exe" not in content
         assert "image.jpg" not in content
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_read_json_file(self, project_path, monkeypatch, use_orjson):
+        """Test JSON reading with and without the orjson fast path"""
+        if use_orjson and not file_utils.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(file_utils, "HAS_ORJSON", use_orjson)
+
+        valid = project_path / "valid.json"
+        valid.write_text('{"models": [{"model_name": "test", "aliases": ["t"]}]}', encoding="utf-8")
+        invalid = project_path / "invalid.json"
+        invalid.write_text("{not json", encoding="utf-8")
+
+        assert read_json_file(str(valid)) == {"models": [{"model_name": "test", "aliases": ["t"]}]}
+        assert read_json_file(str(invalid)) is None
+        assert read_json_file(str(project_path / "missing.json")) is None
+
 
 class TestTokenUtils:
     """Test token counting utilities"""
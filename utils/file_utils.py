@@ -43,6 +43,13 @@ import os
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from .file_types import BINARY_EXTENSIONS, CODE_EXTENSIONS, IMAGE_EXTENSIONS, TEXT_EXTENSIONS
 from .security_config import EXCLUDED_DIRS, is_dangerous_path
 from .token_utils import DEFAULT_CONTEXT_WINDOW, estimate_tokens
@@ -676,6 +683,9 @@ def read_json_file(file_path: str) -> Optional[dict]:
     """
     Read and parse a JSON file with proper error handling.
 
+    Uses orjson when it is installed (parses straight from bytes in C),
+    falling back to the standard library json module otherwise.
+
     Args:
         file_path: Path to the JSON file
 
@@ -686,6 +696,10 @@ def read_json_file(file_path: str) -> Optional[dict]:
         if not os.path.exists(file_path):
             return None
 
+        if HAS_ORJSON:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(Path(file_path).read_bytes())
+
         with open(file_path, encoding="utf-8") as f:
             return json.load(f)
     except (json.JSONDecodeError, OSError):